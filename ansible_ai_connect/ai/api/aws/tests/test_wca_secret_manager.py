@@ -12,9 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from botocore.exceptions import ClientError
+from django.test import override_settings
 from rest_framework.test import APITestCase
 
 from ansible_ai_connect.ai.api.aws.exceptions import (
@@ -151,3 +152,12 @@ class TestWcaApiKeyClient(APITestCase, WisdomServiceLogAwareTestCase):
         c = AWSSecretManager("dummy", None, "dummy", "dummy", [])
         with self.assertRaises(WcaSecretManagerMissingCredentialsError):
             c.get_client()
+
+    @override_settings(HEALTHCHECK_TIMEOUT=2.5)
+    @patch("ansible_ai_connect.ai.api.aws.wca_secret_manager.boto3.client")
+    def test_client_timeouts(self, client):
+        c = AWSSecretManager("dummy", "dummy", "dummy", "dummy", [])
+        c.get_client()
+        config = client.call_args.kwargs["config"]
+        self.assertEqual(config.connect_timeout, 2.5)
+        self.assertEqual(config.read_timeout, 2.5)
@@ -14,9 +14,10 @@
 
 import logging
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 from django.utils import timezone
@@ -111,7 +112,7 @@ class AWSSecretManager(BaseSecretManager):
         aws_secret_access_key,
         kms_secret_id,
         primary_region,
-        replica_regions: list[str],
+        replica_regions: Sequence[str],
     ):
         self.replica_regions = replica_regions
         self.kms_secret_id = kms_secret_id
@@ -131,6 +132,11 @@ class AWSSecretManager(BaseSecretManager):
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
                 region_name=self.primary_region,
+                # The health check calls get_secret() too, bound its calls by the same timeout
+                config=Config(
+                    connect_timeout=settings.HEALTHCHECK_TIMEOUT,
+                    read_timeout=settings.HEALTHCHECK_TIMEOUT,
+                ),
             )
         return self._client
 
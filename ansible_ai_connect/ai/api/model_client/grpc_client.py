@@ -40,6 +40,8 @@ class GrpcClient(ModelMeshClient):
     def __init__(self, inference_url):
         super().__init__(inference_url=inference_url)
         self._inference_stub = self.get_inference_stub()
+        # Reuse the health check connection across probes
+        self.session = requests.Session()
 
     def get_inference_stub(self) -> wisdomextservice_pb2_grpc.WisdomExtServiceStub:
         logger.debug("Inference URL: " + self._inference_url)
@@ -90,7 +92,7 @@ class GrpcClient(ModelMeshClient):
             }
         )
         try:
-            res = requests.get(url)
+            res = self.session.get(url, timeout=settings.HEALTHCHECK_TIMEOUT)
             res.raise_for_status()
         except Exception as e:
             logger.exception(str(e))
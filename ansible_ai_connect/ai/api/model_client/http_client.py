@@ -71,7 +71,7 @@ class HttpClient(ModelMeshClient):
             }
         )
         try:
-            res = requests.get(url, verify=True)
+            res = self.session.get(url, verify=True, timeout=settings.HEALTHCHECK_TIMEOUT)
             res.raise_for_status()
         except Exception as e:
             logger.exception(str(e))
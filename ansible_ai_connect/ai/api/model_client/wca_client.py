@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import base64
+import copy
 import json
 import logging
 import sys
@@ -161,6 +162,17 @@ class WcaModelRequestException(ServiceUnavailable):
     """There was an error trying to invoke a WCA Model."""
 
 
+class HealthCheckSession(requests.Session):
+    """
+    Session of the health check self tests, bounding all their requests by
+    HEALTHCHECK_TIMEOUT, including the token request that has no timeout otherwise.
+    """
+
+    def post(self, url, **kwargs):
+        kwargs["timeout"] = settings.HEALTHCHECK_TIMEOUT
+        return super().post(url, **kwargs)
+
+
 class DummyWCAClient(ModelMeshClient):
     def __init__(self, inference_url):
         super().__init__(inference_url=inference_url)
@@ -316,6 +328,19 @@ class BaseWCAClient(ModelMeshClient):
 
         return response
 
+    def self_test_infer(self, api_key, model_id):
+        # The requests are made by a copy of the client using a HealthCheckSession, so that
+        # the health check thread always ends
+        with HealthCheckSession() as session:
+            client = copy.copy(self)
+            client.session = session
+            return client.infer_from_parameters(
+                api_key,
+                model_id,
+                "",
+                "- name: install ffmpeg on Red Hat Enterprise Linux",
+            )
+
     @abstractmethod
     def get_api_key(self, user, organization_id: Optional[int]) -> str:
         raise NotImplementedError
@@ -544,12 +569,7 @@ class WCAClient(BaseWCAClient):
             }
         )
         try:
-            self.infer_from_parameters(
-                wca_api_key,
-                wca_model_id,
-                "",
-                "- name: install ffmpeg on Red Hat Enterprise Linux",
-            )
+            self.self_test_infer(wca_api_key, wca_model_id)
         except WcaInferenceFailure as e:
             logger.exception(str(e))
             summary.add_exception(
@@ -733,12 +753,7 @@ class WCAOnPremClient(BaseWCAClient):
             }
         )
         try:
-            self.infer_from_parameters(
-                wca_api_key,
-                wca_model_id,
-                "",
-                "- name: install ffmpeg on Red Hat Enterprise Linux",
-            )
+            self.self_test_infer(wca_api_key, wca_model_id)
         except Exception as e:
             logger.exception(str(e))
             summary.add_exception(
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import logging
+import re
 import time
 
 import yaml
@@ -30,6 +31,12 @@ from ansible_ai_connect.ai.api.exceptions import (
 from ansible_ai_connect.ai.api.pipelines.common import PipelineElement
 from ansible_ai_connect.ai.api.pipelines.completion_context import CompletionContext
 
+try:
+    # Use the libyaml based loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 preprocess_hist = Histogram(
@@ -40,6 +47,15 @@ preprocess_hist = Histogram(
 
 task_prefix = "- name: "
 
+# Scanner problems that are simplified into a user friendly message. libyaml reports
+# them as "... not allowed in this context" rather than "... not allowed here".
+scanner_problem_messages = (
+    # colon in task
+    (re.compile("mapping values are not allowed", re.IGNORECASE), "Task contains a colon"),
+    # hyphen at start of task
+    (re.compile("sequence entries are not allowed", re.IGNORECASE), "Task starts with a hyphen"),
+)
+
 
 def completion_pre_process(context: CompletionContext):
     prompt = context.payload.prompt
@@ -89,17 +105,13 @@ def completion_pre_process(context: CompletionContext):
 
 
 def simplify_scanner_error(task: str, e: ScannerError) -> str:
-    # "mapping values are not allowed here" <-- colon in task
-    # "sequence entries are not allowed here" <-- hyphen at start of task
     mark: Mark = e.args[3]
     column = mark.column + 1 - (len(task_prefix))
     problem = str(e.problem)
-    if "mapping values are not allowed here" in problem.lower():
-        message_suffix = "Task contains a colon"
-    elif "sequence entries are not allowed here" in problem.lower():
-        message_suffix = "Task starts with a hyphen"
-    else:
-        message_suffix = problem
+    message_suffix = next(
+        (message for pattern, message in scanner_problem_messages if pattern.search(problem)),
+        problem,
+    )
     message = f"Task '{task}' invalid at column {column}. {message_suffix}."
     return message
 
@@ -128,7 +140,7 @@ def completion_validate_multitask_yaml(context: CompletionContext):
             task_error = "Empty task definition."
         else:
             try:
-                yaml.safe_load(f"{task_prefix}{task}")
+                yaml.load(f"{task_prefix}{task}", Loader=SafeLoader)
             except ScannerError as e:
                 task_error = simplify_scanner_error(task, e)
 
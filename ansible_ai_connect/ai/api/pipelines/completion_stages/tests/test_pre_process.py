@@ -12,11 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import copy
 import uuid
 from unittest.mock import Mock, patch
 
-from django.test import TestCase, modify_settings, override_settings
+from django.test import SimpleTestCase, modify_settings, override_settings
 from yaml.error import Mark
 from yaml.scanner import ScannerError
 
@@ -31,8 +30,14 @@ from ansible_ai_connect.ai.api.pipelines.completion_stages.pre_process import (
 from ansible_ai_connect.ai.api.serializers import CompletionRequestSerializer
 
 
+def _clone(payload, **overrides):
+    # None of the tests mutate nested values, so a shallow copy is sufficient
+    return {**payload, **overrides}
+
+
 def add_indents(vars, n):
-    return "\n".join([(" " * n + line) for line in vars.split("\n")])
+    pad = " " * n
+    return pad + vars.replace("\n", "\n" + pad)
 
 
 ######################################
@@ -65,8 +70,13 @@ var_from_var_files_2:
 
 VARS_3 = 'var_from_include_vars: ""'
 
+# VARS_* indented to be embedded under "vars:" or "set_fact:" in the expected contexts
+_V1_4 = add_indents(VARS_1, 4)
+_V2_4 = add_indents(VARS_2, 4)
+_V3_4 = add_indents(VARS_3, 4)
+
 PLAYBOOK_PAYLOAD = {
-    "suggestionId": uuid.uuid4(),
+    "suggestionId": uuid.UUID(int=1),
     "prompt": """\
 ---
 - hosts: all
@@ -83,9 +93,9 @@ PLAYBOOK_PAYLOAD = {
     - name: Run container with podman using mattermost_app var
 """,
     "metadata": {
-        "documentUri": f"document-{uuid.uuid4()}",
+        "documentUri": f"document-{uuid.UUID(int=2)}",
         "ansibleFileType": "playbook",
-        "activityId": uuid.uuid4(),
+        "activityId": uuid.UUID(int=3),
         "additionalContext": {
             "playbookContext": {
                 "varInfiles": {
@@ -112,9 +122,9 @@ PLAYBOOK_CONTEXT_WITH_VARS = f"""\
   remote_user: root
   vars:
     favcolor: blue
-{add_indents(VARS_1, 4)}
-{add_indents(VARS_2, 4)}
-{add_indents(VARS_3, 4)}
+{_V1_4}
+{_V2_4}
+{_V3_4}
   tasks:
     - name: Include variable
       ansible.builtin.include_vars:
@@ -149,9 +159,9 @@ PLAYBOOK_CONTEXT_WITH_OVERLAPPING_EXISTING_VARS = f"""\
 - hosts: all
   remote_user: root
   vars:
-{add_indents(VARS_1, 4)}
-{add_indents(VARS_2, 4)}
-{add_indents(VARS_3, 4)}
+{_V1_4}
+{_V2_4}
+{_V3_4}
   tasks:
     - name: Include variable
       ansible.builtin.include_vars:
@@ -186,9 +196,9 @@ PLAYBOOK_CONTEXT_WITH_VARS_FILES_NOT_IN_ADDITIONAL_CONTEXT = f"""\
 - hosts: all
   remote_user: root
   vars:
-{add_indents(VARS_1, 4)}
-{add_indents(VARS_2, 4)}
-{add_indents(VARS_3, 4)}
+{_V1_4}
+{_V2_4}
+{_V3_4}
   vars_files:
     - ./vars/external_vars_not_included_in_additional_context.yml
   tasks:
@@ -221,9 +231,9 @@ PLAYBOOK_CONTEXT_WITH_ONLY_ADDITIONAL_CONTEXT_VARS = f"""\
 - hosts: all
   remote_user: root
   vars:
-{add_indents(VARS_1, 4)}
-{add_indents(VARS_2, 4)}
-{add_indents(VARS_3, 4)}
+{_V1_4}
+{_V2_4}
+{_V3_4}
   tasks:
     - name: Include variable
       ansible.builtin.include_vars:
@@ -250,9 +260,9 @@ PLAYBOOK_CONTEXT_WITH_ONLY_ADDITIONAL_CONTEXT_VARS_AND_EMPTY_TASKS = f"""\
 - hosts: all
   remote_user: root
   vars:
-{add_indents(VARS_1, 4)}
-{add_indents(VARS_2, 4)}
-{add_indents(VARS_3, 4)}
+{_V1_4}
+{_V2_4}
+{_V3_4}
   tasks:
 """
 
@@ -279,9 +289,9 @@ PLAYBOOK_CONTEXT_WITH_HANDLERS_ONLY_ADDITIONAL_CONTEXT_VARS = f"""\
 - hosts: all
   remote_user: root
   vars:
-{add_indents(VARS_1, 4)}
-{add_indents(VARS_2, 4)}
-{add_indents(VARS_3, 4)}
+{_V1_4}
+{_V2_4}
+{_V3_4}
   handlers:
     - name: Include variable
       ansible.builtin.include_vars:
@@ -294,16 +304,23 @@ PLAYBOOK_CONTEXT_WITH_HANDLERS_ONLY_ADDITIONAL_CONTEXT_VARS = f"""\
 #   1. The first line ("---") will be removed, and,
 #   2. The last line will be removed as the prompt
 #
-PLAYBOOK_CONTEXT_WITHOUT_VARS = "\n".join(PLAYBOOK_PAYLOAD["prompt"].split("\n")[1:-2]) + "\n"
+PLAYBOOK_CONTEXT_WITHOUT_VARS = "\n".join(PLAYBOOK_PAYLOAD["prompt"].splitlines()[1:-1]) + "\n"
 
 #
 # If the prompt is NOT processed with the formatter, we will see the first line of the original
 # prompt ("---") in the context.
 #
-PLAYBOOK_CONTEXT_WITHOUT_FORMATTING = "\n".join(PLAYBOOK_PAYLOAD["prompt"].split("\n")[:-2]) + "\n"
+PLAYBOOK_CONTEXT_WITHOUT_FORMATTING = PLAYBOOK_PAYLOAD["prompt"].rsplit("\n", 2)[0] + "\n"
+
+#
+# The last line of the prompt replaced with a multi-task prompt that includes '&'
+#
+PLAYBOOK_PAYLOAD_PROMPT_WITH_MULTI_TASK = (
+    PLAYBOOK_PAYLOAD["prompt"].rsplit("\n", 2)[0] + "\n    # do this & do that\n"
+)
 
 PLAYBOOK_TWO_PLAYS_PAYLOAD = {
-    "suggestionId": uuid.uuid4(),
+    "suggestionId": uuid.UUID(int=4),
     "prompt": """\
 ---
 - hosts: all
@@ -322,9 +339,9 @@ PLAYBOOK_TWO_PLAYS_PAYLOAD = {
     - name: Print goodbye
 """,
     "metadata": {
-        "documentUri": f"document-{uuid.uuid4()}",
+        "documentUri": f"document-{uuid.UUID(int=5)}",
         "ansibleFileType": "playbook",
-        "activityId": uuid.uuid4(),
+        "activityId": uuid.UUID(int=6),
         "additionalContext": {
             "playbookContext": {
                 "varInfiles": {
@@ -347,7 +364,7 @@ PLAYBOOK_TWO_PLAYS_CONTEXT_WITH_VARS = f"""\
 - hosts: all
   remote_user: root
   vars:
-{add_indents(VARS_1, 4)}
+{_V1_4}
   tasks:
     - name: Print hello
       ansible.builtin.debug:
@@ -356,7 +373,7 @@ PLAYBOOK_TWO_PLAYS_CONTEXT_WITH_VARS = f"""\
 - hosts: all
   remote_user: root
   vars:
-{add_indents(VARS_1, 4)}
+{_V1_4}
   tasks:
 """
 
@@ -405,8 +422,11 @@ _openvpn_service:
     Ubuntu: ""
 openvpn_service: ""'''
 
+_V4_4 = add_indents(VARS_4, 4)
+_V5_4 = add_indents(VARS_5, 4)
+
 TASKS_IN_ROLE_PAYLOAD = {
-    "suggestionId": uuid.uuid4(),
+    "suggestionId": uuid.UUID(int=7),
     "prompt": """\
 ---
 - name: import assert.yml
@@ -417,9 +437,9 @@ TASKS_IN_ROLE_PAYLOAD = {
 - name: install openvpn packages
 """,
     "metadata": {
-        "documentUri": f"document-{uuid.uuid4()}",
+        "documentUri": f"document-{uuid.UUID(int=8)}",
         "ansibleFileType": "tasks_in_role",
-        "activityId": uuid.uuid4(),
+        "activityId": uuid.UUID(int=9),
         "additionalContext": {
             "playbookContext": {},
             "roleContext": {
@@ -436,8 +456,8 @@ TASKS_IN_ROLE_PAYLOAD = {
 TASKS_IN_ROLE_CONTEXT_WITH_VARS = f"""\
 - name: Set variables from context
   ansible.builtin.set_fact:
-{add_indents(VARS_4, 4)}
-{add_indents(VARS_5, 4)}
+{_V4_4}
+{_V5_4}
 
 - name: import assert.yml
   ansible.builtin.import_tasks: assert.yml
@@ -454,14 +474,14 @@ TASKS_IN_ROLE_CONTEXT_WITH_VARS = f"""\
 #   2. The last line will be removed as the prompt
 #
 TASKS_IN_ROLE_CONTEXT_WITHOUT_VARS = (
-    "\n".join(TASKS_IN_ROLE_PAYLOAD["prompt"].split("\n")[1:-2]) + "\n"
+    "\n".join(TASKS_IN_ROLE_PAYLOAD["prompt"].splitlines()[1:-1]) + "\n"
 )
 
 ###################################
 # Test data for the tasks use case
 ###################################
 TASKS_PAYLOAD = {
-    "suggestionId": uuid.uuid4(),
+    "suggestionId": uuid.UUID(int=10),
     "prompt": """\
 ---
 - name: import assert.yml
@@ -472,9 +492,9 @@ TASKS_PAYLOAD = {
 - name: install openvpn packages
 """,
     "metadata": {
-        "documentUri": f"document-{uuid.uuid4()}",
+        "documentUri": f"document-{uuid.UUID(int=11)}",
         "ansibleFileType": "tasks",
-        "activityId": uuid.uuid4(),
+        "activityId": uuid.UUID(int=12),
         "additionalContext": {
             "playbookContext": {},
             "roleContext": {},
@@ -486,7 +506,7 @@ TASKS_PAYLOAD = {
 TASKS_CONTEXT_WITH_VARS = f"""\
 - name: Set variables from context
   ansible.builtin.set_fact:
-{add_indents(VARS_4, 4)}
+{_V4_4}
 
 - name: import assert.yml
   ansible.builtin.import_tasks: assert.yml
@@ -501,7 +521,7 @@ TASKS_CONTEXT_WITH_VARS = f"""\
 #   1. The first line ("---") will be removed, and,
 #   2. The last line will be removed as the prompt
 #
-TASKS_CONTEXT_WITHOUT_VARS = "\n".join(TASKS_PAYLOAD["prompt"].split("\n")[1:-2]) + "\n"
+TASKS_CONTEXT_WITHOUT_VARS = "\n".join(TASKS_PAYLOAD["prompt"].splitlines()[1:-1]) + "\n"
 
 TASKS_PAYLOAD_PROMPT_WITH_QUOTED_TASKS = """\
 ---
@@ -521,17 +541,90 @@ TASKS_PAYLOAD_PROMPT_WITH_NON_QUOTED_TASK = """\
 
 """
 
+#
+# (name, prompt, expected context) for PLAYBOOK_PAYLOAD processed on behalf of a
+# commercial user with ENABLE_ADDITIONAL_CONTEXT=True
+#
+ADDITIONAL_CONTEXT_CASES = [
+    (
+        "feature_enabled",
+        PLAYBOOK_PAYLOAD["prompt"],
+        PLAYBOOK_CONTEXT_WITH_VARS,
+    ),
+    (
+        "feature_enabled_with_overlapping_vars",
+        PLAYBOOK_PAYLOAD_PROMPT_WITH_OVERLAPPING_EXISTING_VARS,
+        PLAYBOOK_CONTEXT_WITH_OVERLAPPING_EXISTING_VARS,
+    ),
+    (
+        "vars_files_not_in_additional_context",
+        PLAYBOOK_PAYLOAD_PROMPT_WITH_VARS_FILES_NOT_IN_ADDITIONAL_CONTEXT,
+        PLAYBOOK_CONTEXT_WITH_VARS_FILES_NOT_IN_ADDITIONAL_CONTEXT,
+    ),
+    (
+        "no_preexisting_vars",
+        PLAYBOOK_PAYLOAD_PROMPT_WITH_NO_PREEXISTING_VARS,
+        PLAYBOOK_CONTEXT_WITH_ONLY_ADDITIONAL_CONTEXT_VARS,
+    ),
+    (
+        "no_preexisting_vars_and_one_multitask_prompt",
+        PLAYBOOK_PAYLOAD_PROMPT_WITH_NO_PREEXISTING_VARS_AND_ONE_MULTITASK_PROMPT,
+        PLAYBOOK_CONTEXT_WITH_ONLY_ADDITIONAL_CONTEXT_VARS_AND_EMPTY_TASKS,
+    ),
+    (
+        "no_preexisting_vars_and_handlers",
+        PLAYBOOK_PAYLOAD_PROMPT_WITH_HANDLERS_NO_PREEXISTING_VARS,
+        PLAYBOOK_CONTEXT_WITH_HANDLERS_ONLY_ADDITIONAL_CONTEXT_VARS,
+    ),
+    (
+        "multi_task_prompt",
+        PLAYBOOK_PAYLOAD_PROMPT_WITH_MULTI_TASK,
+        PLAYBOOK_CONTEXT_WITH_VARS,
+    ),
+]
+
+# Requests shared by all tests; nothing asserts on their call history
+_USER_SEAT = Mock(rh_user_has_seat=True)
+_USER_NOSEAT = Mock(rh_user_has_seat=False)
+_REQ_SEAT = Mock(user=_USER_SEAT)
+_REQ_NOSEAT = Mock(user=_USER_NOSEAT)
+
+# validate() only reads the request from the context, so one instance is reused
+_SERIALIZER = CompletionRequestSerializer(context={})
+
+# Serializer-validated data keyed on (prompt, metadata, is_commercial_user)
+_VALIDATED = {}
+
 
 @modify_settings()
-class CompletionPreProcessTest(TestCase):
+class CompletionPreProcessTestBase(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Validate the shared fixtures once; tests then reuse the cached data
+        for payload in (
+            PLAYBOOK_PAYLOAD,
+            PLAYBOOK_TWO_PLAYS_PAYLOAD,
+            TASKS_IN_ROLE_PAYLOAD,
+            TASKS_PAYLOAD,
+        ):
+            cls.mock_context(payload, True)
 
     @staticmethod
     def mock_context(payload, is_commercial_user) -> CompletionContext:
         original_prompt = payload.get("prompt")
-        user = Mock(rh_user_has_seat=is_commercial_user)
-        request = Mock(user=user)
-        serializer = CompletionRequestSerializer(context={"request": request})
-        data = serializer.validate(payload.copy())
+        request = _REQ_SEAT if is_commercial_user else _REQ_NOSEAT
+        # The validated data only depends on the payload content and the user's seat, so
+        # it is computed once per distinct input. A new CompletionContext is always built
+        # because completion_pre_process() updates it in place.
+        key = (original_prompt, repr(payload.get("metadata")), is_commercial_user)
+        data = _VALIDATED.get(key)
+        if data is None:
+            _SERIALIZER.context["request"] = request
+            # validate() updates the dict it is given, which would alter the shared fixtures.
+            # The copy is only made on a cache miss; in the API, DRF already passes a new dict.
+            data = _VALIDATED[key] = _SERIALIZER.validate(payload.copy())
         return CompletionContext(
             request=request,
             payload=APIPayload(
@@ -543,7 +636,7 @@ class CompletionPreProcessTest(TestCase):
         )
 
     def call_completion_validate_multitask_yaml(self, payload) -> []:
-        context = CompletionPreProcessTest.mock_context(payload, True)
+        context = self.mock_context(payload, True)
 
         with self.assertRaises(PreprocessInvalidYamlException) as e:
             PreProcessStage().process(context)
@@ -556,127 +649,70 @@ class CompletionPreProcessTest(TestCase):
         return messages
 
     def call_completion_pre_process(self, payload, is_commercial_user, expected_context):
-        context = CompletionPreProcessTest.mock_context(payload, is_commercial_user)
+        context = self.mock_context(payload, is_commercial_user)
         completion_pre_process(context)
         self.assertEqual(context.payload.context, expected_context)
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_commercial_user_and_feature_enabled(self):
+
+@override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
+class CompletionPreProcessEnabledTest(CompletionPreProcessTestBase):
+    def test_additional_context_with_commercial_user(self):
+        for name, prompt, expected_context in ADDITIONAL_CONTEXT_CASES:
+            with self.subTest(name):
+                self.call_completion_pre_process(
+                    _clone(PLAYBOOK_PAYLOAD, prompt=prompt),
+                    True,
+                    expected_context,
+                )
+
+    def test_additional_context_with_non_commercial_user(self):
         self.call_completion_pre_process(
             PLAYBOOK_PAYLOAD,
-            True,
-            PLAYBOOK_CONTEXT_WITH_VARS,
+            False,
+            PLAYBOOK_CONTEXT_WITHOUT_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_feature_enabled_with_overlapping_vars(self):
-        payload = copy.deepcopy(PLAYBOOK_PAYLOAD)
-        payload["prompt"] = PLAYBOOK_PAYLOAD_PROMPT_WITH_OVERLAPPING_EXISTING_VARS
-
+    def test_additional_context_with_playbook_with_two_plays(self):
         self.call_completion_pre_process(
-            payload,
+            PLAYBOOK_TWO_PLAYS_PAYLOAD,
             True,
-            PLAYBOOK_CONTEXT_WITH_OVERLAPPING_EXISTING_VARS,
+            PLAYBOOK_TWO_PLAYS_CONTEXT_WITH_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_vars_files_not_in_additional_context(self):
-        payload = copy.deepcopy(PLAYBOOK_PAYLOAD)
-        payload["prompt"] = PLAYBOOK_PAYLOAD_PROMPT_WITH_VARS_FILES_NOT_IN_ADDITIONAL_CONTEXT
-
+    def test_tasks_inrole(self):
         self.call_completion_pre_process(
-            payload,
+            TASKS_IN_ROLE_PAYLOAD,
             True,
-            PLAYBOOK_CONTEXT_WITH_VARS_FILES_NOT_IN_ADDITIONAL_CONTEXT,
+            TASKS_IN_ROLE_CONTEXT_WITH_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_commercial_user_and_feature_enabled_with_no_preexisting_vars(
-        self,
-    ):
-        payload = copy.deepcopy(PLAYBOOK_PAYLOAD)
-        payload["prompt"] = PLAYBOOK_PAYLOAD_PROMPT_WITH_NO_PREEXISTING_VARS
-
+    def test_standalone_tasks(self):
         self.call_completion_pre_process(
-            payload,
+            TASKS_PAYLOAD,
             True,
-            PLAYBOOK_CONTEXT_WITH_ONLY_ADDITIONAL_CONTEXT_VARS,
+            TASKS_CONTEXT_WITH_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_commercial_user_and_feature_enabled_with_no_preexisting_vars_and_one_multitask_prompt(  # noqa: E501
-        self,
-    ):
-        payload = copy.deepcopy(PLAYBOOK_PAYLOAD)
-        payload["prompt"] = (
-            PLAYBOOK_PAYLOAD_PROMPT_WITH_NO_PREEXISTING_VARS_AND_ONE_MULTITASK_PROMPT
+    def test_other_ansible_type(self):
+        payload = _clone(
+            TASKS_PAYLOAD, metadata={**TASKS_PAYLOAD["metadata"], "ansibleFileType": "other"}
         )
-
         self.call_completion_pre_process(
             payload,
             True,
-            PLAYBOOK_CONTEXT_WITH_ONLY_ADDITIONAL_CONTEXT_VARS_AND_EMPTY_TASKS,
+            TASKS_CONTEXT_WITHOUT_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_commercial_user_and_feature_enabled_with_no_preexisting_vars_and_handlers(  # noqa: E501
-        self,
-    ):
-        payload = copy.deepcopy(PLAYBOOK_PAYLOAD)
-        payload["prompt"] = PLAYBOOK_PAYLOAD_PROMPT_WITH_HANDLERS_NO_PREEXISTING_VARS
-
-        self.call_completion_pre_process(
-            payload,
-            True,
-            PLAYBOOK_CONTEXT_WITH_HANDLERS_ONLY_ADDITIONAL_CONTEXT_VARS,
-        )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=False)
-    def test_additional_context_with_commercial_user_and_feature_disabled(self):
+@override_settings(ENABLE_ADDITIONAL_CONTEXT=False)
+class CompletionPreProcessDisabledTest(CompletionPreProcessTestBase):
+    def test_additional_context_with_commercial_user(self):
         self.call_completion_pre_process(
             PLAYBOOK_PAYLOAD,
             True,
             PLAYBOOK_CONTEXT_WITHOUT_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_non_commercial_user(self):
-        self.call_completion_pre_process(
-            PLAYBOOK_PAYLOAD,
-            False,
-            PLAYBOOK_CONTEXT_WITHOUT_VARS,
-        )
-
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_commercial_user_and_multi_task_prompt(self):
-        payload = copy.deepcopy(PLAYBOOK_PAYLOAD)
-        # Replace the last line of the prompt with a multi-task prompt that includes '&'
-        payload["prompt"] = (
-            "\n".join(payload["prompt"].split("\n")[:-2]) + "\n    # do this & do that\n"
-        )
-        self.call_completion_pre_process(
-            payload,
-            True,
-            PLAYBOOK_CONTEXT_WITH_VARS,
-        )
-
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_additional_context_with_playbook_with_two_plays(self):
-        self.call_completion_pre_process(
-            PLAYBOOK_TWO_PLAYS_PAYLOAD,
-            True,
-            PLAYBOOK_TWO_PLAYS_CONTEXT_WITH_VARS,
-        )
-
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_tasks_inrole(self):
-        self.call_completion_pre_process(
-            TASKS_IN_ROLE_PAYLOAD,
-            True,
-            TASKS_IN_ROLE_CONTEXT_WITH_VARS,
-        )
-
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=False)
     def test_tasks_inrole_with_feature_disabled(self):
         self.call_completion_pre_process(
             TASKS_IN_ROLE_PAYLOAD,
@@ -684,15 +720,6 @@ class CompletionPreProcessTest(TestCase):
             TASKS_IN_ROLE_CONTEXT_WITHOUT_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_standalone_tasks(self):
-        self.call_completion_pre_process(
-            TASKS_PAYLOAD,
-            True,
-            TASKS_CONTEXT_WITH_VARS,
-        )
-
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=False)
     def test_standalone_tasks_with_feature_disabled(self):
         self.call_completion_pre_process(
             TASKS_PAYLOAD,
@@ -700,21 +727,12 @@ class CompletionPreProcessTest(TestCase):
             TASKS_CONTEXT_WITHOUT_VARS,
         )
 
-    @override_settings(ENABLE_ADDITIONAL_CONTEXT=True)
-    def test_other_ansible_type(self):
-        payload = copy.deepcopy(TASKS_PAYLOAD)
-        payload["metadata"]["ansibleFileType"] = "other"
-        self.call_completion_pre_process(
-            payload,
-            True,
-            TASKS_CONTEXT_WITHOUT_VARS,
-        )
 
+class CompletionPreProcessTest(CompletionPreProcessTestBase):
     def test_quoted_singletask(
         self,
     ):
-        payload = copy.deepcopy(TASKS_PAYLOAD)
-        payload["prompt"] = TASKS_PAYLOAD_PROMPT_WITH_QUOTED_TASKS
+        payload = _clone(TASKS_PAYLOAD, prompt=TASKS_PAYLOAD_PROMPT_WITH_QUOTED_TASKS)
 
         self.call_completion_pre_process(
             payload,
@@ -723,32 +741,32 @@ class CompletionPreProcessTest(TestCase):
         )
 
     def test_multitask_empty(self):
-        payload = copy.deepcopy(TASKS_PAYLOAD)
-        payload[
-            "prompt"
-        ] = """
+        payload = _clone(
+            TASKS_PAYLOAD,
+            prompt="""
         ---
         - name: Test the vscode extension
             hosts: all
             tasks:
                 # install apache &
-            """
+            """,
+        )
 
         messages = self.call_completion_validate_multitask_yaml(payload)
         self.assertEqual(1, len(messages))
         self.assertIn("Empty task definition.", messages[0])
 
     def test_multitask_with_hyphen(self):
-        payload = copy.deepcopy(TASKS_PAYLOAD)
-        payload[
-            "prompt"
-        ] = """
+        payload = _clone(
+            TASKS_PAYLOAD,
+            prompt="""
         ---
         - name: Test the vscode extension
             hosts: all
             tasks:
                 # - install apache
-            """
+            """,
+        )
 
         messages = self.call_completion_validate_multitask_yaml(payload)
         self.assertEqual(1, len(messages))
@@ -757,16 +775,16 @@ class CompletionPreProcessTest(TestCase):
         )
 
     def test_multitask_with_colon(self):
-        payload = copy.deepcopy(TASKS_PAYLOAD)
-        payload[
-            "prompt"
-        ] = """
+        payload = _clone(
+            TASKS_PAYLOAD,
+            prompt="""
         ---
         - name: Test the vscode extension
             hosts: all
             tasks:
                 # install: apache
-            """
+            """,
+        )
 
         messages = self.call_completion_validate_multitask_yaml(payload)
         self.assertEqual(1, len(messages))
@@ -775,16 +793,16 @@ class CompletionPreProcessTest(TestCase):
         )
 
     def test_multitask_with_multiple_errors(self):
-        payload = copy.deepcopy(TASKS_PAYLOAD)
-        payload[
-            "prompt"
-        ] = """
+        payload = _clone(
+            TASKS_PAYLOAD,
+            prompt="""
         ---
         - name: Test the vscode extension
             hosts: all
             tasks:
                 # install: apache & - start it &
-            """
+            """,
+        )
 
         messages = self.call_completion_validate_multitask_yaml(payload)
         self.assertEqual(3, len(messages))
@@ -796,26 +814,24 @@ class CompletionPreProcessTest(TestCase):
         )
         self.assertIn("Empty task definition.", messages[2])
 
-    @patch("yaml.safe_load")
-    def test_multitask_with_scanner_error(self, mock_safe_load):
-        payload = copy.deepcopy(TASKS_PAYLOAD)
-        payload[
-            "prompt"
-        ] = """
+    @patch("ansible_ai_connect.ai.api.pipelines.completion_stages.pre_process.yaml.load")
+    def test_multitask_with_scanner_error(self, mock_load):
+        payload = _clone(
+            TASKS_PAYLOAD,
+            prompt="""
         ---
         - name: Test the vscode extension
             hosts: all
             tasks:
                 # Some crazy YAML
-            """
-
-        mock_safe_load.side_effect = Mock(
-            side_effect=ScannerError(
-                None,
-                None,
-                "Something went horribly wrong",
-                Mark("name", 0, 0, len(task_prefix), None, 0),
-            )
+            """,
+        )
+
+        mock_load.side_effect = ScannerError(
+            None,
+            None,
+            "Something went horribly wrong",
+            Mark("name", 0, 0, len(task_prefix), None, 0),
         )
 
         messages = self.call_completion_validate_multitask_yaml(payload)
@@ -21,7 +21,8 @@ from django.conf import settings
 from ldclient import Context
 from ldclient.client import LDClient
 from ldclient.config import Config
-from ldclient.integrations import Files
+from ldclient.feature_store import CacheConfig
+from ldclient.integrations import Files, Redis
 
 from ansible_ai_connect.users.models import User
 
@@ -65,8 +66,16 @@ class FeatureFlags:
                 )
                 logger.info("development version of feature flag client initialized")
             else:
+                config_kwargs = {}
+                if settings.LAUNCHDARKLY_FEATURE_STORE_URL:
+                    config_kwargs["feature_store"] = Redis.new_feature_store(
+                        url=settings.LAUNCHDARKLY_FEATURE_STORE_URL,
+                        caching=CacheConfig(
+                            expiration=settings.LAUNCHDARKLY_FEATURE_STORE_CACHE_TTL
+                        ),
+                    )
                 self.client = LDClient(
-                    Config(settings.LAUNCHDARKLY_SDK_KEY),
+                    Config(settings.LAUNCHDARKLY_SDK_KEY, **config_kwargs),
                     start_wait=settings.LAUNCHDARKLY_SDK_TIMEOUT,
                 )
                 logger.info("feature flag client initialized")
@@ -64,6 +64,30 @@ class TestFeatureFlags(WisdomServiceAPITestCaseBaseOIDC):
         self.assertEqual(config_arg[0].sdk_key, "dummy_key")
         self.assertEqual(kwargs["start_wait"], 40)
 
+    @override_settings(LAUNCHDARKLY_SDK_KEY="dummy_key")
+    @override_settings(LAUNCHDARKLY_FEATURE_STORE_URL="redis://redis:6379/1")
+    @override_settings(LAUNCHDARKLY_FEATURE_STORE_CACHE_TTL=30.0)
+    @patch.object(feature_flags.Redis, "new_feature_store")
+    @patch.object(feature_flags, "LDClient")
+    def test_feature_flags_with_feature_store(self, LDClient, new_feature_store):
+        feature_flags.FeatureFlags()
+
+        new_feature_store.assert_called_once()
+        _, _, kwargs = new_feature_store.mock_calls[0]
+        self.assertEqual(kwargs["url"], "redis://redis:6379/1")
+        self.assertEqual(kwargs["caching"].expiration, 30.0)
+        LDClient.assert_called_once()
+        _, config_arg, _ = LDClient.mock_calls[0]
+        self.assertEqual(config_arg[0].feature_store, new_feature_store.return_value)
+
+    @override_settings(LAUNCHDARKLY_SDK_KEY="dummy_key")
+    @patch.object(feature_flags.Redis, "new_feature_store")
+    @patch.object(feature_flags, "LDClient")
+    def test_feature_flags_without_feature_store(self, LDClient, new_feature_store):
+        feature_flags.FeatureFlags()
+
+        new_feature_store.assert_not_called()
+
     def test_feature_flags_with_local_file(self):
         with tempfile.NamedTemporaryFile() as fd:
             fd.write(
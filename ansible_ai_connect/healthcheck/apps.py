@@ -23,9 +23,11 @@ class HealthCheckAppConfig(AppConfig):
         from .backends import (
             AuthorizationHealthCheck,
             AWSSecretManagerHealthCheck,
+            DatabaseHealthCheck,
             ModelServerHealthCheck,
         )
 
+        plugin_dir.register(DatabaseHealthCheck)
         plugin_dir.register(ModelServerHealthCheck)
         plugin_dir.register(AWSSecretManagerHealthCheck)
         plugin_dir.register(AuthorizationHealthCheck)
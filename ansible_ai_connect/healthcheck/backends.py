@@ -14,6 +14,7 @@
 
 from django.apps import apps
 from django.conf import settings
+from django.db import DatabaseError, connection, transaction
 from health_check.backends import BaseHealthCheckBackend
 from health_check.exceptions import HealthCheckException, ServiceUnavailable
 
@@ -48,11 +49,42 @@ class HealthCheckSummary:
         self.items.update({key: message})
 
 
+class DatabaseHealthCheck(BaseHealthCheckBackend):
+    """
+    Same as health_check.db.backends.DatabaseBackend but with a single "SELECT 1"
+    round-trip, rather than creating, updating and deleting a row of its test model.
+    """
+
+    def check_status(self):
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                if connection.vendor == "postgresql":
+                    # Bound the query by the health check timeout, for this transaction only
+                    timeout_ms = int(settings.HEALTHCHECK_TIMEOUT * 1000)
+                    cursor.execute(
+                        "SELECT set_config('statement_timeout', %s, true)", [str(timeout_ms)]
+                    )
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+        except DatabaseError:
+            raise ServiceUnavailable("Database error")
+
+
 class BaseLightspeedHealthCheck(BaseHealthCheckBackend):  # noqa
     enabled = True
+    # Name of the setting enabling the check, the check is always enabled if None
+    enabled_setting: str | None = None
 
     summary: HealthCheckSummary = HealthCheckSummary({})
 
+    def is_enabled(self) -> bool:
+        return self.enabled_setting is None or getattr(settings, self.enabled_setting)
+
+    def disable(self):
+        # Report the check as disabled without running it
+        self.enabled = False
+        self.time_taken = 0
+
     def pretty_status(self):
         if not self.enabled:
             return "disabled"
@@ -77,9 +109,10 @@ class ModelServerHealthCheck(BaseLightspeedHealthCheck):
     # If this is set to False, the status endpoints will respond with a 200
     # status code even if the check errors.
     critical_service = True
+    enabled_setting = "ENABLE_HEALTHCHECK_MODEL_MESH"
 
     def check_status(self):
-        self.enabled = settings.ENABLE_HEALTHCHECK_MODEL_MESH
+        self.enabled = self.is_enabled()
         if not self.enabled:
             return
 
@@ -97,9 +130,10 @@ class ModelServerHealthCheck(BaseLightspeedHealthCheck):
 
 class AWSSecretManagerHealthCheck(BaseLightspeedHealthCheck):
     critical_service = True
+    enabled_setting = "ENABLE_HEALTHCHECK_SECRET_MANAGER"
 
     def check_status(self):
-        self.enabled = settings.ENABLE_HEALTHCHECK_SECRET_MANAGER
+        self.enabled = self.is_enabled()
         if not self.enabled:
             return
 
@@ -116,9 +150,10 @@ class AWSSecretManagerHealthCheck(BaseLightspeedHealthCheck):
 
 class AuthorizationHealthCheck(BaseLightspeedHealthCheck):
     critical_service = True
+    enabled_setting = "ENABLE_HEALTHCHECK_AUTHORIZATION"
 
     def check_status(self):
-        self.enabled = settings.ENABLE_HEALTHCHECK_AUTHORIZATION
+        self.enabled = self.is_enabled()
         if not self.enabled:
             return
 
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    health_check.db is no longer installed, the database is checked with a "SELECT 1"
+    by DatabaseHealthCheck. Its test model table is dropped from existing databases.
+    """
+
+    dependencies = []
+
+    operations = [
+        migrations.RunSQL(
+            "DROP TABLE IF EXISTS health_check_db_testmodel;",
+            reverse_sql=migrations.RunSQL.noop,
+        )
+    ]
@@ -14,28 +14,47 @@
 
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
+import orjson
 from django.conf import settings
-from django.http import HttpResponse, JsonResponse
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_response_headers,
+    set_response_etag,
+)
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page, never_cache
+from django.views.decorators.cache import never_cache
 from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiResponse,
     OpenApiTypes,
     extend_schema,
 )
+from health_check.conf import HEALTH_CHECK
+from health_check.exceptions import ServiceUnavailable, ServiceWarning
 from health_check.views import MainView
 from rest_framework import permissions
 from rest_framework.views import APIView
 
-from ansible_ai_connect.healthcheck.backends import BaseLightspeedHealthCheck
+from ansible_ai_connect.healthcheck.backends import (
+    ERROR_MESSAGE,
+    BaseLightspeedHealthCheck,
+)
 
 from .version_info import VersionInfo
 
 logger = logging.getLogger(__name__)
 CACHE_TIMEOUT = 30
+# Failed checks are cached shortly, so that pollers see a recovery soon
+ERROR_CACHE_TIMEOUT = 5
+CACHE_KEY = "health_check_response"
+TIMEOUT_MESSAGE = "timeout"
 _version_info = VersionInfo()
 
 
@@ -54,7 +73,7 @@ def common_data():
 
 class HealthCheckCustomView(MainView):
     _plugin_name_map = {
-        "DatabaseBackend": "db",
+        "DatabaseHealthCheck": "db",
         "ModelServerHealthCheck": "model-server",
         "AWSSecretManagerHealthCheck": "secret-manager",
         "WCAHealthCheck": "wca",
@@ -62,31 +81,104 @@ class HealthCheckCustomView(MainView):
         "AuthorizationHealthCheck": "authorization",
     }
 
-    @method_decorator(cache_page(CACHE_TIMEOUT))
     def get(self, request, *args, **kwargs):
-        status_code = 200  # Set status code to 200 for letting the output be cached
-        return self.render_to_response_json(self.plugins, status_code, request.user)
+        # The rendered content is cached with its status code, so that cache hits neither run
+        # the checks nor need the content to be parsed again.
+        cached = cache.get(CACHE_KEY)
+        if cached is None:
+            # CheckMixin.errors runs the checks again whenever there are no errors,
+            # they are evaluated once for both the status code and the content.
+            errors = self.errors
+            status_code = 500 if errors else 200
+            res = self.render_to_response_json(self.plugins, status_code, errors)
+            timeout = ERROR_CACHE_TIMEOUT if errors else CACHE_TIMEOUT
+            cache.set(CACHE_KEY, (status_code, res.content), timeout)
+        else:
+            status_code, content = cached
+            res = HttpResponse(content, content_type="application/json", status=status_code)
+            timeout = CACHE_TIMEOUT if status_code == 200 else ERROR_CACHE_TIMEOUT
+        set_response_etag(res)
+        patch_response_headers(res, timeout)
+        # Pollers that already have the cached content get a 304 without a body
+        return get_conditional_response(request, etag=res["ETag"], response=res)
+
+    def _run_plugin(self, plugin):
+        self._started[plugin] = time.perf_counter()
+        try:
+            plugin.run_check()
+        except Exception as e:
+            # Report unexpected failures against the plugin rather than failing all checks
+            plugin.add_error(ServiceUnavailable(ERROR_MESSAGE), e)
+        finally:
+            connections.close_all()
+        return plugin
+
+    def run_check(self):
+        # Same as MainView.run_check(), all plugins are run concurrently so that the overall
+        # latency is that of the slowest check, but each plugin is isolated from the others
+        # and plugins not completed within HEALTHCHECK_TIMEOUT are reported as timed out.
+        errors = []
+        # perf_counter() value when each plugin started running
+        self._started = {}
+        plugins = []
+        for p in self.plugins:
+            # Disabled checks are reported as such without being scheduled
+            if isinstance(p, BaseLightspeedHealthCheck) and not p.is_enabled():
+                p.disable()
+            else:
+                plugins.append(p)
+        executor = ThreadPoolExecutor(max_workers=len(plugins) or 1)
+        futures = {executor.submit(self._run_plugin, p): p for p in plugins}
+        # The plugins completing after the deadline are reported as timed out, even if they
+        # complete while the results are collected.
+        done, not_done = wait(futures, timeout=settings.HEALTHCHECK_TIMEOUT)
+        # Do not wait for the plugins that timed out. They bound their requests and queries
+        # by HEALTHCHECK_TIMEOUT too, so their threads end shortly after.
+        executor.shutdown(wait=False, cancel_futures=True)
+        now = time.perf_counter()
+        # Time (in seconds) each plugin not completed within HEALTHCHECK_TIMEOUT had been running
+        self._timed_out = {
+            futures[future]: now - self._started.get(futures[future], now) for future in not_done
+        }
+        errors.extend(
+            ServiceUnavailable(TIMEOUT_MESSAGE)
+            for plugin in self._timed_out
+            if plugin.critical_service
+        )
+        for future in done:
+            plugin = future.result()
+            if not plugin.critical_service:
+                continue
+            if HEALTH_CHECK["WARNINGS_AS_ERRORS"]:
+                errors.extend(plugin.errors)
+            else:
+                errors.extend(e for e in plugin.errors if not isinstance(e, ServiceWarning))
+        return errors
 
-    def render_to_response_json(self, plugins, status, user):  # customize JSON output
-        data = common_data()
-        data["status"] = "error" if self.errors else "ok"
+    def render_to_response_json(self, plugins, status, errors):  # customize JSON output
+        data = {"status": "error" if errors else "ok", **common_data()}
 
         dependencies = []
         for p in plugins:
             plugins_id = self._plugin_name_map.get(p.identifier(), "unknown")
-            if isinstance(p, BaseLightspeedHealthCheck):
+            timed_out = p in self._timed_out
+            if timed_out:
+                plugin_status = str(ServiceUnavailable(TIMEOUT_MESSAGE))
+                time_taken = round(self._timed_out[p] * 1000, 3)
+            elif isinstance(p, BaseLightspeedHealthCheck):
                 plugin_status = p.pretty_status()
+                time_taken = round(p.time_taken * 1000, 3)
             else:
                 plugin_status = str(p.pretty_status()) if p.errors else "ok"
-            time_taken = round(p.time_taken * 1000, 3)
+                time_taken = round(p.time_taken * 1000, 3)
             plugin_data = {"name": plugins_id, "status": plugin_status, "time_taken": time_taken}
-            if not p.status:
+            if timed_out or not p.status:
                 logger.error(f"HEALTH CHECK ERROR: {json.dumps(plugin_data)}")
             dependencies.append(plugin_data)
 
         data["dependencies"] = dependencies
 
-        return JsonResponse(data, status=status)
+        return HttpResponse(orjson.dumps(data), content_type="application/json", status=status)
 
 
 class WisdomServiceHealthView(APIView):
@@ -126,13 +218,7 @@ class WisdomServiceHealthView(APIView):
         summary="Health check with backend server status",
     )
     def get(self, request, *args, **kwargs):
-        res = self.customView.get(request, *args, **kwargs)
-        # res contains status_code = 200 for utilizing view cache.  We need to set the correct
-        # status code based on the status attribute stored in the JSON content
-        data = json.loads(res.content)
-        if data["status"] != "ok":
-            res.status_code = 500
-        return res
+        return self.customView.get(request, *args, **kwargs)
 
 
 class WisdomServiceLivenessProbeView(APIView):
@@ -150,7 +236,5 @@ class WisdomServiceLivenessProbeView(APIView):
     )
     @method_decorator(never_cache)
     def get(self, request, *args, **kwargs):
-        data = common_data()
-        data["status"] = "ok"
-        data_json = json.dumps(data)
-        return HttpResponse(data_json, content_type="application/json")
+        data = {"status": "ok", **common_data()}
+        return HttpResponse(orjson.dumps(data), content_type="application/json")
@@ -74,6 +74,9 @@ class SegmentMiddleware:
                 # segment_analytics_telemetry.send = False # for code development only
                 segment_analytics_telemetry.on_error = on_segment_analytics_error
 
+        # Only completion requests are tracked: this is checked once per request, and
+        # non-POST requests do not need the reverse() lookup.
+        track_completion = False
         if settings.SEGMENT_WRITE_KEY:
             if not analytics.write_key:
                 analytics.write_key = settings.SEGMENT_WRITE_KEY
@@ -82,7 +85,8 @@ class SegmentMiddleware:
                 # analytics.send = False # for code development only
                 analytics.on_error = on_segment_error
 
-            if request.path == reverse("completions") and request.method == "POST":
+            track_completion = request.method == "POST" and request.path == reverse("completions")
+            if track_completion:
                 if request.content_type == "application/json":
                     try:
                         request_data = (
@@ -96,81 +100,80 @@ class SegmentMiddleware:
 
         response = self.get_response(request)
 
-        if settings.SEGMENT_WRITE_KEY:
-            if request.path == reverse("completions") and request.method == "POST":
-                request_suggestion_id = getattr(
-                    request, "_suggestion_id", request_data.get("suggestionId")
+        if track_completion:
+            request_suggestion_id = getattr(
+                request, "_suggestion_id", request_data.get("suggestionId")
+            )
+            if not request_suggestion_id:
+                request_suggestion_id = str(uuid.uuid4())
+            context = request_data.get("context")
+            prompt = request_data.get("prompt")
+            model_name = request_data.get("model", "")
+            metadata = request_data.get("metadata", {})
+            promptType = getattr(request, "_prompt_type", None)
+
+            predictions = None
+            message = None
+            response_data = getattr(response, "data", {})
+
+            if isinstance(response_data, dict):
+                predictions = response_data.get("predictions")
+                message = response_data.get("message")
+                if isinstance(message, ErrorDetail):
+                    message = str(message)
+                model_name = response_data.get("model", model_name)
+                # For other error cases, remove 'model' in response data
+                if response.status_code >= 400:
+                    response_data.pop("model", None)
+            elif response.status_code >= 400 and getattr(response, "content", None):
+                message = str(response.content)
+
+            duration = round((time.time() - start_time) * 1000, 2)
+            tasks = getattr(response, "tasks", [])
+            event = {
+                "duration": duration,
+                "request": {"context": context, "prompt": prompt},
+                "response": {
+                    "exception": getattr(response, "exception", None),
+                    # See main.exception_handler.exception_handler_with_error_type
+                    # That extracts 'default_code' from Exceptions and stores it
+                    # in the Response.
+                    "error_type": getattr(response, "error_type", None),
+                    "message": message,
+                    "predictions": predictions,
+                    "status_code": response.status_code,
+                    "status_text": getattr(response, "status_text", None),
+                },
+                "suggestionId": request_suggestion_id,
+                "metadata": metadata,
+                "modelName": model_name,
+                "imageTags": version_info.image_tags,
+                "tasks": tasks,
+                "promptType": promptType,
+                "taskCount": len(tasks),
+            }
+
+            send_segment_event(event, "completion", request.user)
+
+            # Collect analytics telemetry, when tasks exist.
+            if len(tasks) > 0:
+                send_segment_analytics_event(
+                    AnalyticsTelemetryEvents.RECOMMENDATION_GENERATED,
+                    lambda: AnalyticsRecommendationGenerated(
+                        tasks=[
+                            AnalyticsRecommendationTask(
+                                collection=task.get("collection", ""),
+                                module=task.get("module", ""),
+                            )
+                            for task in tasks
+                        ],
+                        rh_user_org_id=getattr(request.user, "org_id", None),
+                        suggestion_id=request_suggestion_id,
+                        model_name=model_name,
+                    ),
+                    request.user,
+                    getattr(request, "_ansible_extension_version", None),
                 )
-                if not request_suggestion_id:
-                    request_suggestion_id = str(uuid.uuid4())
-                context = request_data.get("context")
-                prompt = request_data.get("prompt")
-                model_name = request_data.get("model", "")
-                metadata = request_data.get("metadata", {})
-                promptType = getattr(request, "_prompt_type", None)
-
-                predictions = None
-                message = None
-                response_data = getattr(response, "data", {})
-
-                if isinstance(response_data, dict):
-                    predictions = response_data.get("predictions")
-                    message = response_data.get("message")
-                    if isinstance(message, ErrorDetail):
-                        message = str(message)
-                    model_name = response_data.get("model", model_name)
-                    # For other error cases, remove 'model' in response data
-                    if response.status_code >= 400:
-                        response_data.pop("model", None)
-                elif response.status_code >= 400 and getattr(response, "content", None):
-                    message = str(response.content)
-
-                duration = round((time.time() - start_time) * 1000, 2)
-                tasks = getattr(response, "tasks", [])
-                event = {
-                    "duration": duration,
-                    "request": {"context": context, "prompt": prompt},
-                    "response": {
-                        "exception": getattr(response, "exception", None),
-                        # See main.exception_handler.exception_handler_with_error_type
-                        # That extracts 'default_code' from Exceptions and stores it
-                        # in the Response.
-                        "error_type": getattr(response, "error_type", None),
-                        "message": message,
-                        "predictions": predictions,
-                        "status_code": response.status_code,
-                        "status_text": getattr(response, "status_text", None),
-                    },
-                    "suggestionId": request_suggestion_id,
-                    "metadata": metadata,
-                    "modelName": model_name,
-                    "imageTags": version_info.image_tags,
-                    "tasks": tasks,
-                    "promptType": promptType,
-                    "taskCount": len(tasks),
-                }
-
-                send_segment_event(event, "completion", request.user)
-
-                # Collect analytics telemetry, when tasks exist.
-                if len(tasks) > 0:
-                    send_segment_analytics_event(
-                        AnalyticsTelemetryEvents.RECOMMENDATION_GENERATED,
-                        lambda: AnalyticsRecommendationGenerated(
-                            tasks=[
-                                AnalyticsRecommendationTask(
-                                    collection=task.get("collection", ""),
-                                    module=task.get("module", ""),
-                                )
-                                for task in tasks
-                            ],
-                            rh_user_org_id=getattr(request.user, "org_id", None),
-                            suggestion_id=request_suggestion_id,
-                            model_name=model_name,
-                        ),
-                        request.user,
-                        getattr(request, "_ansible_extension_version", None),
-                    )
 
         # Clean up response.data for 204; should be empty to prevent
         # issues on the client side
@@ -32,9 +32,29 @@ from importlib.resources import files
 from pathlib import Path
 from typing import Literal, cast
 
+from django.core.exceptions import ImproperlyConfigured
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR: Path = files("ansible_ai_connect")
+
+# Report all the missing required environment variables at once, not only the first one
+missing_environment_variables = [
+    name
+    for name in (
+        "SECRET_KEY",
+        "ANSIBLE_AI_DATABASE_NAME",
+        "ANSIBLE_AI_DATABASE_USER",
+        "ANSIBLE_AI_DATABASE_PASSWORD",
+        "ANSIBLE_AI_DATABASE_HOST",
+    )
+    if name not in os.environ
+]
+if missing_environment_variables:
+    raise ImproperlyConfigured(
+        f"Missing environment variables: {', '.join(missing_environment_variables)}"
+    )
+
 ANSIBLE_AI_PROJECT_NAME = os.getenv("ANSIBLE_AI_PROJECT_NAME") or "Ansible AI Connect"
 
 # Quick-start development settings - unsuitable for production
@@ -95,8 +115,15 @@ ALLOWED_HOSTS = ["localhost"]
 
 # Application definition
 
+# The admin dashboard and its helpers can be left out of the workers that only serve the API
+ENABLE_ADMIN_APPS = os.getenv("ENABLE_ADMIN_APPS", "True").lower() == "true"
+
+# The request latency and database metrics of django_prometheus, e.g. to leave them out of CI
+ENABLE_PROMETHEUS = os.getenv("ENABLE_PROMETHEUS", "True").lower() == "true"
+
+# The optional apps keep their position, it matters for the template and static files lookups
 INSTALLED_APPS = [
-    "django.contrib.admin",
+    *(["django.contrib.admin"] if ENABLE_ADMIN_APPS else []),
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",  # Used by the admin dashboard
@@ -107,19 +134,18 @@ INSTALLED_APPS = [
     "ansible_ai_connect.users",
     "ansible_ai_connect.organizations",
     "ansible_ai_connect.ai",
-    "django_prometheus",
+    *(["django_prometheus"] if ENABLE_PROMETHEUS else []),
     "drf_spectacular",
-    "django_extensions",
+    *(["django_extensions"] if ENABLE_ADMIN_APPS else []),
     "health_check",
-    "health_check.db",
     "ansible_ai_connect.healthcheck",
     "oauth2_provider",
-    "import_export",
+    *(["import_export"] if ENABLE_ADMIN_APPS else []),
 ]
 
 MIDDLEWARE = [
     "allow_cidr.middleware.AllowCIDRMiddleware",
-    "django_prometheus.middleware.PrometheusBeforeMiddleware",
+    *(["django_prometheus.middleware.PrometheusBeforeMiddleware"] if ENABLE_PROMETHEUS else []),
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -130,10 +156,15 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "social_django.middleware.SocialAuthExceptionMiddleware",
     "ansible_ai_connect.main.middleware.SegmentMiddleware",
-    "django_prometheus.middleware.PrometheusAfterMiddleware",
+    *(["django_prometheus.middleware.PrometheusAfterMiddleware"] if ENABLE_PROMETHEUS else []),
     "csp.middleware.CSPMiddleware",
 ]
 
+# The API is authenticated with OAuth2 tokens, only the browser flows use sessions. Set
+# SESSION_ENGINE to "django.contrib.sessions.backends.signed_cookies" (or ".cache" with a
+# Redis CACHE_URL) to avoid querying the django_session table on every request.
+SESSION_ENGINE = os.getenv("SESSION_ENGINE") or "django.contrib.sessions.backends.db"
+
 # Allow Prometheus to scrape metrics
 ALLOWED_CIDR_NETS = [os.environ.get("ALLOWED_CIDR_NETS", "10.0.0.0/8")]
 
@@ -157,13 +188,17 @@ COMMERCIAL_DOCUMENTATION_URL = os.getenv(
 TERMS_NOT_APPLICABLE = os.environ.get("TERMS_NOT_APPLICABLE", False)
 
 SOCIAL_AUTH_JSONFIELD_ENABLED = True
+# The GitHub authentication backend, if any, is selected once from the environment
+github_auth_backend = None
 if os.environ.get("SOCIAL_AUTH_GITHUB_TEAM_KEY"):
+    github_auth_backend = "social_core.backends.github.GithubTeamOAuth2"
     SOCIAL_AUTH_GITHUB_TEAM_KEY = os.environ.get("SOCIAL_AUTH_GITHUB_TEAM_KEY")
     SOCIAL_AUTH_GITHUB_TEAM_SECRET = os.environ.get("SOCIAL_AUTH_GITHUB_TEAM_SECRET")
     SOCIAL_AUTH_GITHUB_TEAM_ID = os.environ.get("SOCIAL_AUTH_GITHUB_TEAM_ID") or 7188893
     SOCIAL_AUTH_GITHUB_TEAM_SCOPE = ["read:org"]
     SOCIAL_AUTH_GITHUB_TEAM_EXTRA_DATA = ["login"]
 elif os.environ.get("SOCIAL_AUTH_GITHUB_KEY"):
+    github_auth_backend = "social_core.backends.github.GithubOAuth2"
     SOCIAL_AUTH_GITHUB_KEY = os.environ.get("SOCIAL_AUTH_GITHUB_KEY")
     SOCIAL_AUTH_GITHUB_SECRET = os.environ.get("SOCIAL_AUTH_GITHUB_SECRET")
     SOCIAL_AUTH_GITHUB_SCOPE = [""]
@@ -206,11 +241,11 @@ AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
     "oauth2_provider.backends.OAuth2Backend",
 ]
-if os.environ.get("SOCIAL_AUTH_GITHUB_TEAM_KEY"):
-    AUTHENTICATION_BACKENDS.append("social_core.backends.github.GithubTeamOAuth2")
-elif os.environ.get("SOCIAL_AUTH_GITHUB_KEY"):
-    AUTHENTICATION_BACKENDS.append("social_core.backends.github.GithubOAuth2")
+if github_auth_backend:
+    AUTHENTICATION_BACKENDS.append(github_auth_backend)
 
+# social-core requires dotted paths here: BaseAuth.run_pipeline() resolves each of them with
+# module_member(), which is an import_module() hit in sys.modules plus a getattr() per step.
 SOCIAL_AUTH_PIPELINE = (
     "ansible_ai_connect.users.pipeline.block_auth_users",
     "social_core.pipeline.social_auth.social_details",
@@ -242,15 +277,18 @@ OAUTH2_PROVIDER = {
         "read": "Read basic user information",
         "write": "Request Ansible content suggestions",
     },
-    "ALLOWED_REDIRECT_URI_SCHEMES": [
-        "http",
-        "https",
-        "vscode",
-        "vscodium",
-        "vscode-insiders",
-        "code-oss",
-        "checode",
-    ],
+    # Only used for membership tests, by django-oauth-toolkit and wildcard_oauth2
+    "ALLOWED_REDIRECT_URI_SCHEMES": frozenset(
+        (
+            "http",
+            "https",
+            "vscode",
+            "vscodium",
+            "vscode-insiders",
+            "code-oss",
+            "checode",
+        )
+    ),
     # 14 hours, to match the duration of the Red Hat SSO sessions
     "REFRESH_TOKEN_EXPIRE_SECONDS": 50_400,
 }
@@ -371,7 +409,10 @@ LOGGING = {
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": list(BASE_DIR.glob("*/templates/")),
+        # Resolved once to plain strings rather than Path objects
+        "DIRS": [str(path.resolve()) for path in BASE_DIR.glob("*/templates/")],
+        # Without explicit "loaders", Django (>= 4.1) wraps the filesystem and app directories
+        # loaders in the cached loader, templates are only parsed once per process.
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -397,6 +438,18 @@ DATABASES = {
         "PASSWORD": os.environ["ANSIBLE_AI_DATABASE_PASSWORD"],
         "HOST": os.environ["ANSIBLE_AI_DATABASE_HOST"],
         "PORT": os.getenv("ANSIBLE_AI_DATABASE_PORT") or 5432,
+        # Reuse the connections across requests, 0 closes them at the end of each request
+        "CONN_MAX_AGE": int(os.getenv("ANSIBLE_AI_DATABASE_CONN_MAX_AGE") or 60),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # Time (in seconds) to wait for a new connection, waits forever if 0
+            "connect_timeout": int(os.getenv("ANSIBLE_AI_DATABASE_CONNECT_TIMEOUT") or 10),
+        },
+        # Required when connecting through pgbouncer in transaction pooling mode
+        "DISABLE_SERVER_SIDE_CURSORS": os.getenv(
+            "ANSIBLE_AI_DATABASE_DISABLE_SERVER_SIDE_CURSORS", "False"
+        ).lower()
+        == "true",
     }
 }
 
@@ -440,7 +493,7 @@ STATIC_ROOT = "/var/www/wisdom/public/static"
 
 # Paths to where static files that are not explicitly part of a
 # particular Django app should be collected from.
-STATICFILES_DIRS = list(BASE_DIR.glob("*/static/"))
+STATICFILES_DIRS = [str(path.resolve()) for path in BASE_DIR.glob("*/static/")]
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
@@ -464,11 +517,15 @@ DUMMY_MODEL_RESPONSE_LATENCY_USE_JITTER = bool(
     os.environ.get("DUMMY_MODEL_RESPONSE_LATENCY_USE_JITTER", False)
 )
 
+# The feature toggles are parsed once here. Reading them per request through django.conf.settings
+# is a plain attribute lookup (LazySettings caches each value in its __dict__ on first access), and
+# it keeps them overridable with override_settings() in the tests.
 ENABLE_ARI_POSTPROCESS = os.getenv("ENABLE_ARI_POSTPROCESS", "False").lower() == "true"
 ARI_BASE_DIR = os.getenv("ARI_KB_PATH") or "/etc/ari/kb/"
 ARI_RULES_DIR = os.path.join(ARI_BASE_DIR, "rules")
 ARI_DATA_DIR = os.path.join(ARI_BASE_DIR, "data")
-ARI_RULES = [
+# An immutable tuple rather than a frozenset: ARI orders the loaded rules by their index here
+ARI_RULES = (
     "P001",
     "P002",
     "P003",
@@ -498,9 +555,9 @@ ARI_RULES = [
     "W025",
     "W026",
     "W027",
-]
+)
 if "ARI_RULES" in os.environ:
-    ARI_RULES = os.environ["ARI_RULES"].split(",")
+    ARI_RULES = tuple(os.environ["ARI_RULES"].split(","))
 ARI_RULE_FOR_OUTPUT_RESULT = os.getenv("ARI_RULE_FOR_OUTPUT_RESULT") or "W007"
 
 ENABLE_ANSIBLE_LINT_POSTPROCESS = (
@@ -513,13 +570,50 @@ ENABLE_ADDITIONAL_CONTEXT = os.getenv("ENABLE_ADDITIONAL_CONTEXT", "False").lowe
 
 LAUNCHDARKLY_SDK_KEY = os.getenv("LAUNCHDARKLY_SDK_KEY", "")
 LAUNCHDARKLY_SDK_TIMEOUT = os.getenv("LAUNCHDARKLY_SDK_TIMEOUT", 20)
+# Optional Redis URL where the LaunchDarkly flags are persisted. The last known flags are then
+# served from it while the client (re)connects, e.g. when LaunchDarkly is unreachable at startup.
+LAUNCHDARKLY_FEATURE_STORE_URL = os.getenv("LAUNCHDARKLY_FEATURE_STORE_URL", "")
+LAUNCHDARKLY_FEATURE_STORE_CACHE_TTL = float(
+    os.getenv("LAUNCHDARKLY_FEATURE_STORE_CACHE_TTL") or "60.0"
+)
 
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
-        "LOCATION": "cache",
+# The cache is shared by all the workers and defaults to the database.
+# Set CACHE_URL to a redis:// or rediss:// URL to avoid a SQL query per cache access,
+# or to locmem:// for a single process development server.
+CACHE_URL = os.getenv("CACHE_URL", "")
+if CACHE_URL.startswith(("redis://", "rediss://")):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
     }
-}
+elif CACHE_URL == "locmem://":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "cache",
+        }
+    }
+
+# Throttling reads and writes the cache on every request. Set THROTTLE_CACHE_URL to a redis://
+# or rediss:// URL to throttle with a dedicated Redis cache, whatever CACHE_URL is. With Redis,
+# the requests are counted atomically in a single round-trip.
+THROTTLE_CACHE_URL = os.getenv("THROTTLE_CACHE_URL", "")
+if THROTTLE_CACHE_URL.startswith(("redis://", "rediss://")):
+    CACHES["throttle"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": THROTTLE_CACHE_URL,
+    }
+    THROTTLE_CACHE_ALIAS = "throttle"
+else:
+    THROTTLE_CACHE_ALIAS = "default"
 
 t_wca_secret_backend_type = Literal["dummy", "aws_sm"]
 WCA_SECRET_BACKEND_TYPE: t_wca_secret_backend_type = cast(t_wca_secret_backend_type, "aws_sm")
@@ -528,9 +622,12 @@ WCA_SECRET_MANAGER_ACCESS_KEY = os.getenv("WCA_SECRET_MANAGER_ACCESS_KEY", "")
 WCA_SECRET_MANAGER_SECRET_ACCESS_KEY = os.getenv("WCA_SECRET_MANAGER_SECRET_ACCESS_KEY", "")
 WCA_SECRET_MANAGER_KMS_KEY_ID = os.getenv("WCA_SECRET_MANAGER_KMS_KEY_ID", "")
 WCA_SECRET_MANAGER_PRIMARY_REGION = os.getenv("WCA_SECRET_MANAGER_PRIMARY_REGION", "")
-WCA_SECRET_MANAGER_REPLICA_REGIONS = [
-    c.strip() for c in os.getenv("WCA_SECRET_MANAGER_REPLICA_REGIONS", "").split(",") if c
-]
+# Parsed once into an immutable tuple, blank entries (e.g. "us-east-1, ,eu-west-1") are ignored
+WCA_SECRET_MANAGER_REPLICA_REGIONS = tuple(
+    filter(
+        None, (c.strip() for c in os.getenv("WCA_SECRET_MANAGER_REPLICA_REGIONS", "").split(","))
+    )
+)
 WCA_ENABLE_ARI_POSTPROCESS = os.getenv("WCA_ENABLE_ARI_POSTPROCESS", "False").lower() == "true"
 
 CSP_DEFAULT_SRC = ("'self'", "data:")
@@ -555,6 +652,10 @@ ENABLE_HEALTHCHECK_AUTHORIZATION = (
 ENABLE_HEALTHCHECK_ATTRIBUTION = (
     os.getenv("ENABLE_HEALTHCHECK_ATTRIBUTION", "True").lower() == "true"
 )
+# Time (in seconds) the health check waits for all plugins to complete. Plugins that
+# have not completed by then are reported as unavailable. It is also used as the timeout
+# of the requests and queries made by the checks, so that their threads always end.
+HEALTHCHECK_TIMEOUT = float(os.getenv("HEALTHCHECK_TIMEOUT") or "10.0")
 # ==========================================
 
 # ==========================================
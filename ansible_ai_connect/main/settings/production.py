@@ -21,7 +21,7 @@ ALLOWED_HOSTS = list(filter(len, os.getenv("ANSIBLE_WISDOM_DOMAIN", "").split(",
 
 SOCIAL_AUTH_REDIRECT_IS_HTTPS = os.getenv("SOCIAL_AUTH_REDIRECT_IS_HTTPS", "True").lower() == "true"
 
-SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+SESSION_ENGINE = os.getenv("SESSION_ENGINE") or "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
 # "Schema 2" Telemetry Admin Dashboard URL
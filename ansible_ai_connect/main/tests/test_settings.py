@@ -17,6 +17,7 @@ import os
 from unittest.mock import patch
 
 import django.conf
+from django.core.exceptions import ImproperlyConfigured
 from django.test import SimpleTestCase
 from oauth2_provider.settings import oauth2_settings
 
@@ -49,6 +50,12 @@ class TestSettings(SimpleTestCase, WisdomLogAwareMixin):
         self.assertGreater(REFRESH_TOKEN_EXPIRE_SECONDS, 0)
         self.assertLessEqual(REFRESH_TOKEN_EXPIRE_SECONDS, 864_000)
 
+    def test_oauth2_allowed_redirect_uri_schemes(self):
+        schemes = oauth2_settings.ALLOWED_REDIRECT_URI_SCHEMES
+        self.assertIsInstance(schemes, frozenset)
+        for scheme in ["https", "vscode", "vscodium", "checode"]:
+            self.assertIn(scheme, schemes)
+
     @patch.dict(
         os.environ,
         {
@@ -65,6 +72,12 @@ class TestSettings(SimpleTestCase, WisdomLogAwareMixin):
         self.assertEqual(settings.SOCIAL_AUTH_GITHUB_TEAM_ID, "5678")
         self.assertEqual(settings.SOCIAL_AUTH_GITHUB_TEAM_SCOPE, ["read:org"])
         self.assertEqual(settings.SOCIAL_AUTH_GITHUB_TEAM_EXTRA_DATA, ["login"])
+        self.assertIn(
+            "social_core.backends.github.GithubTeamOAuth2", settings.AUTHENTICATION_BACKENDS
+        )
+        self.assertNotIn(
+            "social_core.backends.github.GithubOAuth2", settings.AUTHENTICATION_BACKENDS
+        )
 
     @patch.dict(
         os.environ,
@@ -96,6 +109,137 @@ class TestSettings(SimpleTestCase, WisdomLogAwareMixin):
         self.assertEqual(settings.SOCIAL_AUTH_GITHUB_SECRET, "secret")
         self.assertEqual(settings.SOCIAL_AUTH_GITHUB_SCOPE, [""])
         self.assertEqual(settings.SOCIAL_AUTH_GITHUB_EXTRA_DATA, ["login"])
+        self.assertIn("social_core.backends.github.GithubOAuth2", settings.AUTHENTICATION_BACKENDS)
+        self.assertNotIn(
+            "social_core.backends.github.GithubTeamOAuth2", settings.AUTHENTICATION_BACKENDS
+        )
+
+    def test_admin_apps(self):
+        settings = self.reload_settings()
+        for app in ["django.contrib.admin", "django_extensions", "import_export"]:
+            self.assertIn(app, settings.INSTALLED_APPS)
+        # The admin templates and static files are looked up before the other apps'
+        self.assertEqual(settings.INSTALLED_APPS[0], "django.contrib.admin")
+        self.assertEqual(settings.INSTALLED_APPS[-1], "import_export")
+
+    @patch.dict(os.environ, {"ENABLE_ADMIN_APPS": "False"})
+    def test_admin_apps_disabled(self):
+        settings = self.reload_settings()
+        for app in ["django.contrib.admin", "django_extensions", "import_export"]:
+            self.assertNotIn(app, settings.INSTALLED_APPS)
+        self.assertIn("ansible_ai_connect.ai", settings.INSTALLED_APPS)
+
+    def test_prometheus(self):
+        with patch.dict(os.environ):
+            os.environ.pop("ENABLE_PROMETHEUS", None)
+            settings = self.reload_settings()
+        self.assertIn("django_prometheus", settings.INSTALLED_APPS)
+        self.assertEqual(
+            settings.MIDDLEWARE[1], "django_prometheus.middleware.PrometheusBeforeMiddleware"
+        )
+        self.assertIn("django_prometheus.middleware.PrometheusAfterMiddleware", settings.MIDDLEWARE)
+
+    @patch.dict(os.environ, {"ENABLE_PROMETHEUS": "False"})
+    def test_prometheus_disabled(self):
+        settings = self.reload_settings()
+        self.assertNotIn("django_prometheus", settings.INSTALLED_APPS)
+        self.assertFalse([m for m in settings.MIDDLEWARE if m.startswith("django_prometheus")])
+
+    @patch.dict(os.environ, {"WCA_SECRET_MANAGER_REPLICA_REGIONS": "us-east-1, ,eu-west-1,"})
+    def test_wca_secret_manager_replica_regions(self):
+        settings = self.reload_settings()
+        self.assertEqual(settings.WCA_SECRET_MANAGER_REPLICA_REGIONS, ("us-east-1", "eu-west-1"))
+
+    def test_missing_environment_variables(self):
+        with patch.dict(os.environ):
+            os.environ.pop("SECRET_KEY")
+            os.environ.pop("ANSIBLE_AI_DATABASE_HOST")
+            with self.assertRaisesMessage(
+                ImproperlyConfigured,
+                "Missing environment variables: SECRET_KEY, ANSIBLE_AI_DATABASE_HOST",
+            ):
+                importlib.reload(ansible_ai_connect.main.settings.base)
+
+    def test_session_engine_default(self):
+        with patch.dict(os.environ):
+            os.environ.pop("SESSION_ENGINE", None)
+            settings = self.reload_settings()
+        self.assertEqual(settings.SESSION_ENGINE, "django.contrib.sessions.backends.db")
+
+    @patch.dict(os.environ, {"SESSION_ENGINE": "django.contrib.sessions.backends.signed_cookies"})
+    def test_session_engine_signed_cookies(self):
+        settings = self.reload_settings()
+        self.assertEqual(settings.SESSION_ENGINE, "django.contrib.sessions.backends.signed_cookies")
+
+    @patch.dict(os.environ, {"ARI_RULES": "W001,W007"})
+    def test_ari_rules(self):
+        settings = self.reload_settings()
+        self.assertEqual(settings.ARI_RULES, ("W001", "W007"))
+
+    def test_database_persistent_connections(self):
+        with patch.dict(os.environ):
+            os.environ.pop("ANSIBLE_AI_DATABASE_CONN_MAX_AGE", None)
+            settings = self.reload_settings()
+        self.assertEqual(settings.DATABASES["default"]["CONN_MAX_AGE"], 60)
+        self.assertTrue(settings.DATABASES["default"]["CONN_HEALTH_CHECKS"])
+        self.assertFalse(settings.DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"])
+
+    @patch.dict(
+        os.environ,
+        {
+            "ANSIBLE_AI_DATABASE_CONN_MAX_AGE": "0",
+            "ANSIBLE_AI_DATABASE_DISABLE_SERVER_SIDE_CURSORS": "True",
+        },
+    )
+    def test_database_connections_for_pgbouncer(self):
+        settings = self.reload_settings()
+        self.assertEqual(settings.DATABASES["default"]["CONN_MAX_AGE"], 0)
+        self.assertTrue(settings.DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"])
+
+    def test_throttle_cache_default(self):
+        with patch.dict(os.environ):
+            os.environ.pop("THROTTLE_CACHE_URL", None)
+            settings = self.reload_settings()
+        self.assertEqual(settings.THROTTLE_CACHE_ALIAS, "default")
+        self.assertNotIn("throttle", settings.CACHES)
+
+    @patch.dict(os.environ, {"THROTTLE_CACHE_URL": "redis://redis:6379/1"})
+    def test_throttle_cache_redis(self):
+        settings = self.reload_settings()
+        self.assertEqual(settings.THROTTLE_CACHE_ALIAS, "throttle")
+        self.assertEqual(
+            settings.CACHES["throttle"],
+            {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://redis:6379/1",
+            },
+        )
+
+    def test_cache_default(self):
+        with patch.dict(os.environ):
+            os.environ.pop("CACHE_URL", None)
+            settings = self.reload_settings()
+        self.assertEqual(
+            settings.CACHES["default"]["BACKEND"], "django.core.cache.backends.db.DatabaseCache"
+        )
+
+    @patch.dict(os.environ, {"CACHE_URL": "redis://redis:6379/0"})
+    def test_cache_redis(self):
+        settings = self.reload_settings()
+        self.assertEqual(
+            settings.CACHES["default"],
+            {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://redis:6379/0",
+            },
+        )
+
+    @patch.dict(os.environ, {"CACHE_URL": "locmem://"})
+    def test_cache_locmem(self):
+        settings = self.reload_settings()
+        self.assertEqual(
+            settings.CACHES["default"]["BACKEND"], "django.core.cache.backends.locmem.LocMemCache"
+        )
 
     @patch.dict(
         os.environ,
@@ -29,7 +29,6 @@ Including another URLconf
 """
 
 from django.conf import settings
-from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import (
     SpectacularAPIView,
@@ -68,7 +67,6 @@ urlpatterns = [
     # Do not add a trailing slash. django_prometheus uses plain /metrics
     # Adding a trailing slash breaks our metric collection in all sorts of ways.
     path("metrics", MetricsView.as_view(), name="prometheus-metrics"),
-    path("admin/", admin.site.urls),
     path(f"api/{WISDOM_API_VERSION}/ai/", include("ansible_ai_connect.ai.api.urls")),
     path(f"api/{WISDOM_API_VERSION}/me/", CurrentUserView.as_view(), name="me"),
     path(
@@ -89,6 +87,13 @@ urlpatterns = [
     path("trial/", TrialView.as_view(), name="trial"),
 ]
 
+if settings.ENABLE_ADMIN_APPS:
+    from django.contrib import admin
+
+    urlpatterns += [
+        path("admin/", admin.site.urls),
+    ]
+
 if settings.DEBUG or settings.DEPLOYMENT_MODE == "saas":
     urlpatterns += [
         path(f"api/{WISDOM_API_VERSION}/wca/", include("ansible_ai_connect.ai.api.wca.urls")),
@@ -11,13 +11,17 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from unittest.mock import Mock, patch
 
 from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.test import override_settings
 
 from ansible_ai_connect.ai.api.views import Completions, Feedback
 from ansible_ai_connect.test_utils import WisdomServiceAPITestCaseBaseOIDC
 
-from ..throttling import GroupSpecificThrottle
+from ..throttling import GroupSpecificThrottle, cached_parse_rate
 
 
 class TestThrottling(WisdomServiceAPITestCaseBaseOIDC):
@@ -68,3 +72,82 @@ class TestThrottling(WisdomServiceAPITestCaseBaseOIDC):
         expected = GroupSpecificThrottle.format_rate(int(num_requests * multiplier), duration)
         rate = throttling.get_rate(Feedback())
         self.assertEqual(rate, expected)
+
+    def test_parse_rate(self):
+        throttling = GroupSpecificThrottle()
+        self.assertEqual(throttling.parse_rate("10/minute"), (10, 60))
+        self.assertEqual(throttling.parse_rate("60/hour"), (60, 3600))
+        self.assertEqual(throttling.parse_rate(None), (None, None))
+
+        hits = cached_parse_rate.cache_info().hits
+        self.assertEqual(throttling.parse_rate("10/minute"), (10, 60))
+        self.assertEqual(cached_parse_rate.cache_info().hits, hits + 1)
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "throttle": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://redis:6379/1",
+            },
+        },
+        THROTTLE_CACHE_ALIAS="throttle",
+    )
+    def test_allow_request_with_redis(self):
+        class DummyRequest:
+            def __init__(self, user):
+                self.user = user
+
+        counters = LocMemCache("throttle", {})
+        request = DummyRequest(self.user)
+        num_requests, duration = cached_parse_rate(settings.COMPLETION_USER_RATE_THROTTLE)
+        now = 100 * duration + 12
+
+        with patch.object(
+            RedisCache, "add", side_effect=lambda *args: counters.add(*args)
+        ) as add, patch.object(
+            RedisCache, "incr", side_effect=lambda *args: counters.incr(*args)
+        ) as incr, patch.object(
+            GroupSpecificThrottle, "timer", Mock(return_value=now)
+        ) as timer:
+            for _ in range(num_requests):
+                throttling = GroupSpecificThrottle()
+                self.assertTrue(throttling.allow_request(request, Completions()))
+                self.assertEqual(throttling.wait(), duration - 12)
+            throttling = GroupSpecificThrottle()
+            self.assertFalse(throttling.allow_request(request, Completions()))
+            self.assertEqual(throttling.wait(), duration - 12)
+            self.assertEqual(add.call_count, num_requests + 1)
+            self.assertEqual(incr.call_count, num_requests + 1)
+
+            # The requests are counted again from the next window on
+            timer.return_value = now + duration
+            throttling = GroupSpecificThrottle()
+            self.assertTrue(throttling.allow_request(request, Completions()))
+            self.assertEqual(throttling.wait(), duration - 12)
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        },
+        THROTTLE_CACHE_ALIAS="default",
+    )
+    def test_allow_request_without_redis(self):
+        class DummyRequest:
+            def __init__(self, user):
+                self.user = user
+
+        request = DummyRequest(self.user)
+        num_requests, duration = cached_parse_rate(settings.COMPLETION_USER_RATE_THROTTLE)
+
+        with patch.object(RedisCache, "incr") as incr:
+            for _ in range(num_requests):
+                throttling = GroupSpecificThrottle()
+                self.assertTrue(throttling.allow_request(request, Completions()))
+            throttling = GroupSpecificThrottle()
+            self.assertFalse(throttling.allow_request(request, Completions()))
+        # DRF's request history is used rather than the Redis counter
+        self.assertIsNone(throttling.remaining_duration)
+        self.assertEqual(len(throttling.history), num_requests)
+        self.assertLessEqual(throttling.wait(), duration)
+        incr.assert_not_called()
@@ -12,10 +12,27 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
+
 from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
 from rest_framework.throttling import UserRateThrottle
 
 
+@functools.lru_cache(maxsize=32)
+def cached_parse_rate(rate):
+    """
+    Same as SimpleRateThrottle.parse_rate(), returns a tuple of
+    (<allowed number of requests>, <period of time in seconds>)
+    """
+    if rate is None:
+        return (None, None)
+    num, period = rate.split("/")
+    duration = {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+    return (int(num), duration)
+
+
 class GroupSpecificThrottle(UserRateThrottle):
     """
     Allows using settings.SPECIAL_THROTTLING_GROUPS to specify Django user Group
@@ -33,11 +50,18 @@ class GroupSpecificThrottle(UserRateThrottle):
     # The attribute name that may be definied in views to give a larger (or smaller) rate limit
     cache_key_multipiler_attr = "throttle_cache_multiplier"
 
+    # Set when the requests are counted in Redis, see allow_request_with_counter()
+    remaining_duration = None
+
     def __init__(self):
         # Override, since we can't decide what the scope and rate are
         # until we see the request.
         pass
 
+    @property
+    def cache(self):
+        return caches[settings.THROTTLE_CACHE_ALIAS]
+
     def get_scope(self, request, view):
         user_groups = set(request.user.groups.values_list("name", flat=True))
         return next((group for group in self.GROUPS if group in user_groups), "user")
@@ -52,8 +76,41 @@ class GroupSpecificThrottle(UserRateThrottle):
         self.rate = self.get_rate(view)
         self.num_requests, self.duration = self.parse_rate(self.rate)
 
+        if isinstance(self.cache, RedisCache):
+            return self.allow_request_with_counter(request, view)
         return super().allow_request(request, view)
 
+    def allow_request_with_counter(self, request, view):
+        # Count the requests of a fixed window with atomic Redis operations, rather than
+        # reading and writing back the whole history of the requests.
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        # The counter of a window expires after the window has ended, never during it
+        key = f"{self.key}_{int(now // self.duration)}"
+        self.cache.add(key, 0, self.duration)
+        count = self.cache.incr(key)
+
+        self.remaining_duration = self.duration - now % self.duration
+        if count > self.num_requests:
+            return self.throttle_failure()
+        return True
+
+    def wait(self):
+        if self.remaining_duration is not None:
+            # The counter is reset once the window expires
+            return self.remaining_duration
+        return super().wait()
+
+    def parse_rate(self, rate):
+        # Only a handful of rates are configured, parse them once rather than on every request
+        return cached_parse_rate(rate)
+
     def get_cache_key(self, request, view):
         cache_key = super().get_cache_key(request, view)
         # If a cache key suffix is defined in the view, append it to the key